@@ -1 +1,6 @@
-from .client import NordpoolClient
\ No newline at end of file
+from .client import NordpoolClient
+
+try:
+    from .async_client import AsyncNordpoolClient
+except ImportError:  # aiohttp is an optional dependency
+    AsyncNordpoolClient = None
\ No newline at end of file
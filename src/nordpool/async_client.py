@@ -0,0 +1,681 @@
+import asyncio
+import ssl
+from datetime import date
+from typing import Optional, Dict, List, Tuple, Union, Any
+
+import aiohttp
+
+from .client import _cached_join
+
+
+class AsyncNordpoolClient:
+    """
+    An asynchronous client for interacting with the Nordpool Data API.
+    Mirrors NordpoolClient but issues requests via aiohttp, allowing several
+    endpoints to be fetched concurrently over a shared connection pool.
+
+    Usage:
+        async with AsyncNordpoolClient() as client:
+            prices, volumes = await asyncio.gather(
+                client.get_day_ahead_prices("2025-03-02", ["NO2"]),
+                client.get_day_ahead_volumes("2025-03-02", ["NO2"]),
+            )
+    """
+
+    # Base configuration
+    BASE_URL = "https://dataportal-api.nordpoolgroup.com/api"
+
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None, connector_limit: int = 20):
+        """
+        Initialise the asynchronous Nordpool client.
+
+        Args:
+            session: Optional aiohttp.ClientSession object. If not provided, a new
+                session will be created on first use and closed with the client.
+            connector_limit: Maximum number of simultaneous connections for the
+                internally created session.
+        """
+
+        self._session = session
+        self._owns_session = session is None
+        self._connector_limit = connector_limit
+
+    async def __aenter__(self) -> "AsyncNordpoolClient":
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            ssl_ctx = ssl.create_default_context()
+            connector = aiohttp.TCPConnector(limit=self._connector_limit, ssl=ssl_ctx)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._owns_session = True
+        return self._session
+
+    async def close(self):
+        """Close the underlying session if this client created it."""
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Dict:
+        """
+        Make a GET request to the API.
+
+        Args:
+            endpoint: API endpoint to call
+            params: Query parameters
+
+        Returns:
+            JSON response as dictionary
+        """
+        session = await self._ensure_session()
+        url = f"{self.BASE_URL}/{endpoint}"
+        async with session.get(url, params=params) as response:
+            response.raise_for_status()  # Raise exception for non-200 responses
+            return await response.json()
+
+    async def fetch_many(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict]:
+        """
+        Fetch several endpoints concurrently.
+
+        Args:
+            calls: List of (endpoint, params) tuples, as accepted by _make_request.
+
+        Returns:
+            List of JSON responses in the same order as the input calls.
+        """
+        return list(await asyncio.gather(*(self._make_request(e, p) for e, p in calls)))
+
+    @staticmethod
+    def _normalize_date(query_date: Union[str, date]) -> str:
+        """Return query_date as an ISO string, with a fast path for str input."""
+        return query_date if type(query_date) is str else query_date.isoformat()
+
+    @staticmethod
+    def _join_areas(delivery_areas: List[str], preserve_order: bool = False) -> str:
+        """
+        Join delivery areas into the comma-separated form the API expects.
+
+        Areas are de-duplicated and sorted by default, so equivalent lists
+        produce identical URLs and hit the same HTTP cache entries. Pass
+        preserve_order=True to keep the caller's ordering verbatim.
+        """
+        if preserve_order:
+            return ",".join(delivery_areas)
+        return _cached_join(tuple(sorted(set(delivery_areas))))
+
+    # Auction Data
+    async def get_auction_data_availability(self, **kwargs) -> Dict:
+        """
+        Get the latest available auction data.
+
+        Args:
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            dict: Latest auction config.
+        """
+        endpoint = "AuctionDataAvailability"
+        params = {}
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    async def get_auction_data_availability_latest(self, **kwargs) -> Dict:
+        """
+        Get the latest available auction data.
+
+        Args:
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            dict: Latest auction data availability.
+        """
+        endpoint = "AuctionDataAvailability/GetLatest"
+        params = {}
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    async def get_day_ahead_prices(self, query_date: Union[str, date], delivery_areas: List[str],
+                                   currency: str = "EUR", market: str = "DayAhead", **kwargs) -> Dict:
+        """
+        Get day ahead prices for multiple areas.
+
+        Args:
+            query_date: Date for which to retrieve data (YYYY-MM-DD)
+            delivery_areas: List of delivery areas
+            currency: Currency code
+            market: Market code
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            Day ahead prices data
+        """
+        query_date = self._normalize_date(query_date)
+
+        endpoint = "DayAheadPrices"
+        params = {
+            "date": query_date,
+            "market": market,
+            "deliveryArea": self._join_areas(delivery_areas, preserve_order=kwargs.pop("preserve_order", False)),
+            "currency": currency
+        }
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    async def get_single_area_price_history(self, query_date: Union[str, date], delivery_area: str,
+                                            currency: str = "EUR", market: str = "DayAhead", **kwargs) -> Dict:
+        """
+        Get price history for a single delivery area.
+
+        Args:
+            query_date: Date for which to retrieve data (YYYY-MM-DD)
+            delivery_area: Delivery area code
+            currency: Currency code
+            market: Market code
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            Price history data for the specified area
+        """
+        query_date = self._normalize_date(query_date)
+
+        endpoint = "DayAheadPrices/singleAreaHistory"
+        params = {
+            "date": query_date,
+            "market": market,
+            "deliveryArea": delivery_area,
+            "currency": currency
+        }
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    async def get_aggregate_prices(self, year: int, delivery_areas: List[str],
+                                   currency: str = "EUR", market: str = "DayAhead", **kwargs) -> Dict:
+        """
+        Get aggregated prices for a year.
+
+        Args:
+            year: Year for which to retrieve data
+            delivery_areas: List of delivery areas
+            currency: Currency code
+            market: Market code
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            Aggregated price data
+        """
+        endpoint = "AggregatePrices"
+        params = {
+            "year": year,
+            "market": market,
+            "deliveryArea": self._join_areas(delivery_areas, preserve_order=kwargs.pop("preserve_order", False)),
+            "currency": currency
+        }
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    async def get_annual_aggregate_prices(self, delivery_areas: List[str],
+                                          currency: str = "EUR", market: str = "DayAhead", **kwargs) -> Dict:
+        """
+        Get annual aggregated prices.
+
+        Args:
+            delivery_areas: List of delivery areas
+            currency: Currency code
+            market: Market code
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            Annual aggregated price data
+        """
+        endpoint = "AggregatePrices/GetAnnuals"
+        params = {
+            "market": market,
+            "deliveryArea": self._join_areas(delivery_areas, preserve_order=kwargs.pop("preserve_order", False)),
+            "currency": currency
+        }
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    async def get_system_price(self, query_date: Union[str, date], currency: str = "EUR", **kwargs) -> Dict:
+        """
+        Get system price data.
+
+        Args:
+            query_date: Date for which to retrieve data (YYYY-MM-DD)
+            currency: Currency code
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            System price data
+        """
+        query_date = self._normalize_date(query_date)
+
+        endpoint = "DayAheadSystem"
+        params = {
+            "date": query_date,
+            "currency": currency
+        }
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    async def get_day_ahead_volumes(self, query_date: Union[str, date], delivery_areas: List[str],
+                                    market: str = "DayAhead", **kwargs) -> Dict:
+        """
+        Get day ahead volumes for multiple areas.
+
+        Args:
+            query_date: Date for which to retrieve data (YYYY-MM-DD)
+            delivery_areas: List of delivery areas
+            market: Market code
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            Day ahead volumes data
+        """
+        query_date = self._normalize_date(query_date)
+
+        endpoint = "DayAheadVolumes/multiple"
+        params = {
+            "date": query_date,
+            "market": market,
+            "deliveryAreas": self._join_areas(delivery_areas, preserve_order=kwargs.pop("preserve_order", False))
+        }
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    async def get_day_ahead_capacities(self, query_date: Union[str, date], delivery_area: str,
+                                       market: str = "DayAhead", **kwargs) -> Dict:
+        """
+        Get day ahead capacities for a delivery area.
+
+        Args:
+            query_date: Date for which to retrieve data (YYYY-MM-DD)
+            delivery_area: Delivery area code
+            market: Market code
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            Day ahead capacities data
+        """
+        query_date = self._normalize_date(query_date)
+
+        endpoint = "DayAheadCapacities"
+        params = {
+            "date": query_date,
+            "market": market,
+            "deliveryArea": delivery_area
+        }
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    async def get_day_ahead_flow(self, query_date: Union[str, date], delivery_area: str,
+                                 market: str = "DayAhead", **kwargs) -> Dict:
+        """
+        Get day ahead flow for a delivery area.
+
+        Args:
+            query_date: Date for which to retrieve data (YYYY-MM-DD)
+            delivery_area: Delivery area code
+            market: Market code
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            Day ahead flow data
+        """
+        query_date = self._normalize_date(query_date)
+
+        endpoint = "DayAheadFlow"
+        params = {
+            "date": query_date,
+            "market": market,
+            "deliveryArea": delivery_area
+        }
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    async def get_aggregated_bid_curves(self, query_date: Union[str, date], market_code: str,
+                                        cluster_name: str, **kwargs) -> Dict:
+        """
+        Get aggregated bidding curves.
+
+        Args:
+            query_date: Date for which to retrieve data (YYYY-MM-DD)
+            market_code: Market code (e.g., NPSDA, IDA2)
+            cluster_name: Cluster name (e.g., BALTIC, NO)
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            Aggregated bidding curves data
+        """
+        query_date = self._normalize_date(query_date)
+
+        endpoint = "AggregatedBidCurves"
+        params = {
+            "date": query_date,
+            "marketCode": market_code,
+            "clusterName": cluster_name
+        }
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    async def get_scheduled_physical_flows(self, query_date: Union[str, date], delivery_area: str,
+                                           market: str = "DayAhead", **kwargs) -> Dict:
+        """
+        Get scheduled physical flows for a delivery area.
+
+        Args:
+            query_date: Date for which to retrieve data (YYYY-MM-DD)
+            delivery_area: Delivery area code
+            market: Market code
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            Scheduled physical flows data
+        """
+        query_date = self._normalize_date(query_date)
+
+        endpoint = "DayAheadFlow/scheduledPhysicalFlows"
+        params = {
+            "date": query_date,
+            "market": market,
+            "deliveryArea": delivery_area
+        }
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    async def get_flow_based_constraints(self, query_date: Union[str, date], flow_based_domain: str,
+                                         market: str = "DayAhead", **kwargs) -> Dict:
+        """
+        Get flow-based constraints.
+
+        Args:
+            query_date: Date for which to retrieve data (YYYY-MM-DD)
+            flow_based_domain: Flow-based domain code
+            market: Market code
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            Flow-based constraints data
+        """
+        query_date = self._normalize_date(query_date)
+
+        endpoint = "AuctionFlowConstraints"
+        params = {
+            "date": query_date,
+            "market": market,
+            "flowBasedDomain": flow_based_domain
+        }
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    # EPAD data
+
+    async def get_epad_results(self, query_date: Union[str, date], **kwargs) -> Dict:
+        """
+        Get EPAD auction results.
+
+        Args:
+            query_date: Date for which to retrieve data (YYYY-MM-DD)
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            EPAD auction results
+        """
+        query_date = self._normalize_date(query_date)
+
+        endpoint = f"EpadData/results/{query_date}"
+        params = {}
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    async def get_epad_yearly_results(self, year: int, **kwargs) -> Dict:
+        """
+        Get yearly EPAD results.
+
+        Args:
+            year: Year for which to retrieve data
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            Yearly EPAD results
+        """
+        endpoint = f"EpadData/years/results/{year}"
+        params = {}
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    async def get_epad_bid_curves(self, query_date: Union[str, date], **kwargs) -> Dict:
+        """
+        Get EPAD bid curves.
+
+        Args:
+            query_date: Date for which to retrieve data (YYYY-MM-DD)
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            EPAD bid curves
+        """
+        query_date = self._normalize_date(query_date)
+
+        endpoint = f"EpadData/bid-curves/{query_date}"
+        params = {}
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    async def get_epad_yearly_bid_curves(self, year: int, **kwargs) -> Dict:
+        """
+        Get yearly EPAD bid curves.
+
+        Args:
+            year: Year for which to retrieve data
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            Yearly EPAD bid curves
+        """
+        endpoint = f"EpadData/years/bid-curve/{year}"
+        params = {}
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    # Intraday market
+
+    async def get_intraday_market_statistics(self, query_date: Union[str, date], delivery_area: str,
+                                             **kwargs) -> Dict:
+        """
+        Get intraday market statistics.
+
+        Args:
+            query_date: Date for which to retrieve data (YYYY-MM-DD)
+            delivery_area: Delivery area code
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            Intraday market statistics
+        """
+        query_date = self._normalize_date(query_date)
+
+        endpoint = "IntradayMarketStatistics"
+        params = {
+            "date": query_date,
+            "deliveryArea": delivery_area
+        }
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    async def get_intraday_hourly_statistics(self, query_date: Union[str, date], delivery_area: str,
+                                             **kwargs) -> Dict:
+        """
+        Get hourly intraday market statistics.
+
+        Args:
+            query_date: Date for which to retrieve data (YYYY-MM-DD)
+            delivery_area: Delivery area code
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            Hourly intraday market statistics
+        """
+        query_date = self._normalize_date(query_date)
+
+        endpoint = "IntradayMarketStatistics/hourly"
+        params = {
+            "date": query_date,
+            "deliveryArea": delivery_area
+        }
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    # Power system data
+
+    async def get_manual_frequency_restoration_reserve(self, query_date: Union[str, date],
+                                                       delivery_areas: List[str], **kwargs) -> Dict:
+        """
+        Get manual frequency restoration reserve (mFRR) data.
+
+        Args:
+            query_date: Date for which to retrieve data (YYYY-MM-DD)
+            delivery_areas: List of delivery areas
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            mFRR data
+        """
+        query_date = self._normalize_date(query_date)
+
+        endpoint = "ManualFrequencyRestorationReserve/multiple"
+        params = {
+            "date": query_date,
+            "deliveryAreas": self._join_areas(delivery_areas, preserve_order=kwargs.pop("preserve_order", False))
+        }
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    async def get_consumption(self, query_date: Union[str, date], delivery_areas: List[str],
+                              locations: List[str] = None, **kwargs) -> Dict:
+        """
+        Get consumption data.
+
+        Args:
+            query_date: Date for which to retrieve data (YYYY-MM-DD)
+            delivery_areas: List of delivery areas
+            locations: Optional list of specific locations
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            Consumption data
+        """
+        query_date = self._normalize_date(query_date)
+
+        endpoint = "Consumption"
+        params = {
+            "date": query_date,
+            "deliveryAreas": self._join_areas(delivery_areas, preserve_order=kwargs.pop("preserve_order", False)),
+            "locations": ",".join(locations) if locations else ""
+        }
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    async def get_consumption_forecast(self, query_date: Union[str, date], delivery_areas: List[str],
+                                       locations: List[str] = None, **kwargs) -> Dict:
+        """
+        Get consumption forecast data.
+
+        Args:
+            query_date: Date for which to retrieve data (YYYY-MM-DD)
+            delivery_areas: List of delivery areas
+            locations: Optional list of specific locations
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            Consumption forecast data
+        """
+        query_date = self._normalize_date(query_date)
+
+        endpoint = "ConsumptionPrognoses"
+        params = {
+            "date": query_date,
+            "deliveryAreas": self._join_areas(delivery_areas, preserve_order=kwargs.pop("preserve_order", False)),
+            "locations": ",".join(locations) if locations else ""
+        }
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    async def get_production(self, query_date: Union[str, date], delivery_area: str,
+                             location: str = "", **kwargs) -> Dict:
+        """
+        Get production data.
+
+        Args:
+            query_date: Date for which to retrieve data (YYYY-MM-DD)
+            delivery_area: Delivery area code
+            location: Optional specific location
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            Production data
+        """
+        query_date = self._normalize_date(query_date)
+
+        endpoint = "ProductionData"
+        params = {
+            "date": query_date,
+            "deliveryArea": delivery_area,
+            "location": location
+        }
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+    async def get_physical_flows(self, query_date: Union[str, date], delivery_area: str, **kwargs) -> Dict:
+        """
+        Get physical flows data.
+
+        Args:
+            query_date: Date for which to retrieve data (YYYY-MM-DD)
+            delivery_area: Delivery area code
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            Physical flows data
+        """
+        query_date = self._normalize_date(query_date)
+
+        endpoint = "PhysicalFlows"
+        params = {
+            "date": query_date,
+            "deliveryArea": delivery_area
+        }
+        if kwargs:
+            params.update(kwargs)
+        return await self._make_request(endpoint, params)
+
+
+if __name__ == '__main__':
+    pass
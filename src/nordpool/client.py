@@ -1,9 +1,88 @@
 import requests
+from urllib3.util.retry import Retry
+
+try:
+    # Advertises br/zstd too when the decoders are installed
+    from urllib3.util.request import ACCEPT_ENCODING
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import date
-from typing import Optional, Dict, List, Set, Union, Any
+from typing import Optional, Dict, Iterator, List, Set, Union, Any
 import datetime
 import json
 import os
+import string
+import tempfile
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; stdlib json works fine
+    orjson = None
+
+try:
+    from requests_cache import CachedSession
+except ImportError:  # requests-cache is an optional speedup
+    CachedSession = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; only the iter_* streaming variants need it
+    ijson = None
+
+try:
+    import httpx
+except ImportError:  # httpx is optional; only needed for HTTP/2 support
+    httpx = None
+
+
+@lru_cache(maxsize=64)
+def _template_fields(template: str) -> tuple:
+    """Extract (and memoize) the placeholder names in an endpoint template."""
+    return tuple(field for _, field, _, _ in string.Formatter().parse(template) if field)
+
+
+@lru_cache(maxsize=256)
+def _endpoint_url(base_url: str, endpoint: str) -> str:
+    """Build (and memoize) the full URL for an endpoint."""
+    return f"{base_url}/{endpoint}"
+
+
+@lru_cache(maxsize=128)
+def _cached_join(areas: tuple) -> str:
+    """Memoized comma-join for repeated multi-area calls with the same areas."""
+    return ",".join(areas)
+
+
+class _BytesIterReader:
+    """Minimal file-like wrapper over an iterator of byte chunks, for ijson."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._buffer = b""
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            try:
+                self._buffer += next(self._chunks)
+            except StopIteration:
+                break
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def _dump_json(data: Any, path: str):
+    """Write data to path as indented JSON, using orjson when available."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=4)
 
 
 class NordpoolClient:
@@ -15,22 +94,141 @@ class NordpoolClient:
     # Base configuration
     BASE_URL = "https://dataportal-api.nordpoolgroup.com/api"
 
-    def __init__(self, session: Optional[requests.Session] = None):
+    # How long the on-disk auction config cache stays fresh (seconds)
+    AUCTION_CACHE_TTL = 6 * 3600
+
+    # Declarative endpoint table backing the generic call() dispatcher.
+    # Placeholders in braces are filled (and consumed) from the call arguments;
+    # everything else is passed through as query parameters.
+    _ENDPOINTS = {
+        "auction_data_availability": "AuctionDataAvailability",
+        "auction_data_availability_latest": "AuctionDataAvailability/GetLatest",
+        "day_ahead_prices": "DayAheadPrices",
+        "single_area_price_history": "DayAheadPrices/singleAreaHistory",
+        "aggregate_prices": "AggregatePrices",
+        "annual_aggregate_prices": "AggregatePrices/GetAnnuals",
+        "system_price": "DayAheadSystem",
+        "day_ahead_volumes": "DayAheadVolumes/multiple",
+        "day_ahead_capacities": "DayAheadCapacities",
+        "day_ahead_flow": "DayAheadFlow",
+        "aggregated_bid_curves": "AggregatedBidCurves",
+        "scheduled_physical_flows": "DayAheadFlow/scheduledPhysicalFlows",
+        "flow_based_constraints": "AuctionFlowConstraints",
+        "epad_results": "EpadData/results/{date}",
+        "epad_yearly_results": "EpadData/years/results/{year}",
+        "epad_bid_curves": "EpadData/bid-curves/{date}",
+        "epad_yearly_bid_curves": "EpadData/years/bid-curve/{year}",
+        "intraday_market_statistics": "IntradayMarketStatistics",
+        "intraday_hourly_statistics": "IntradayMarketStatistics/hourly",
+        "manual_frequency_restoration_reserve": "ManualFrequencyRestorationReserve/multiple",
+        "consumption": "Consumption",
+        "consumption_forecast": "ConsumptionPrognoses",
+        "production": "ProductionData",
+        "physical_flows": "PhysicalFlows",
+    }
+
+    def __init__(self, session: Optional[requests.Session] = None, eager_init: bool = False,
+                 http_cache: bool = True, http2: bool = False):
         """
         Initialise the Nordpool client.
 
         Args:
-            session: Optional requests.Session object. If not provided, a new session will be created.
+            session: Optional requests.Session (or compatible, e.g. httpx.Client)
+                object. If not provided, a new session will be created.
+            eager_init: If True, fetch the auction config immediately as earlier
+                versions did. By default it is loaded lazily on first access.
+            http_cache: If True and requests-cache is installed, back the default
+                session with an HTTP response cache. Repeat calls within the TTL
+                are served from disk with no round-trip; responses to historical
+                queries are kept indefinitely.
+            http2: If True, use an httpx.Client with HTTP/2 so concurrent calls
+                multiplex over one TLS connection. Requires httpx with the h2
+                extra and takes precedence over http_cache.
         """
 
-        self.session = session or requests.Session()
-
-        self.auction_config = self.get_auction_data_availability()
-        self._update_market_config()
+        if session is not None:
+            self.session = session
+        elif http2:
+            if httpx is None:
+                raise ImportError("httpx is required for HTTP/2 support; "
+                                  "install it via 'pip install nordpool-client[http2]'")
+            self.session = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+                timeout=30
+            )
+        elif http_cache and CachedSession is not None:
+            self.session = CachedSession(
+                cache_name=os.path.join(tempfile.gettempdir(), "nordpool_http"),
+                backend="sqlite",
+                expire_after=3600,
+                allowable_methods=("GET",),
+                stale_if_error=True
+            )
+        else:
+            self.session = requests.Session()
+
+        # Size the connection pool for concurrent fan-out and retry transient failures
+        if isinstance(self.session, requests.Session):
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=32,
+                max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 502, 503, 504))
+            )
+            self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "User-Agent": "nordpool-client/1.0"
+        })
 
         self.D = datetime.date.today().strftime("%Y-%m-%d")
 
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
+        self._auction_cache_path = os.path.join(self.script_dir, ".auction_cache.json")
+        self._avail_path = os.path.join(self.script_dir, "AuctionDataAvailability.json")
+        self._avail_latest_path = os.path.join(self.script_dir, "AuctionDataAvailabilityLatest.json")
+
+        self._auction_config = None
+        self._markets_info = None
+
+        if eager_init:
+            self._update_market_config()
+
+    @property
+    def auction_config(self) -> List[Dict]:
+        """
+        Auction config, fetched lazily on first access.
+
+        Served from a small on-disk JSON cache while it is younger than
+        AUCTION_CACHE_TTL, so short-lived scripts skip the startup round-trip.
+        """
+        if self._auction_config is None:
+            self._auction_config = self._load_auction_config()
+        return self._auction_config
+
+    @property
+    def markets_info(self) -> Dict[str, str]:
+        """Mapping of market code to display name, derived from auction_config."""
+        if self._markets_info is None:
+            self._update_market_config()
+        return self._markets_info
+
+    def _load_auction_config(self) -> List[Dict]:
+        """Load the auction config from the disk cache if fresh, else fetch and cache it."""
+        try:
+            if os.path.getmtime(self._auction_cache_path) + self.AUCTION_CACHE_TTL > datetime.datetime.now().timestamp():
+                with open(self._auction_cache_path) as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            pass  # Missing, stale or corrupt cache - fall through to a fresh fetch
+
+        config = self.get_auction_data_availability()
+        try:
+            with open(self._auction_cache_path, "w") as f:
+                json.dump(config, f)
+        except OSError:
+            pass  # Cache directory not writable - still return the fetched config
+        return config
 
     def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Dict:
         """
@@ -43,18 +241,114 @@ class NordpoolClient:
         Returns:
             JSON response as dictionary
         """
-        url = f"{self.BASE_URL}/{endpoint}"
-        response = self.session.get(url, params=params)
+        url = _endpoint_url(self.BASE_URL, endpoint)
+        request_kwargs = {}
+        if CachedSession is not None and isinstance(self.session, CachedSession):
+            query_date = params.get("date")
+            if query_date and str(query_date) < self.D:
+                request_kwargs["expire_after"] = -1  # Historical data never changes
+        response = self.session.get(url, params=params, **request_kwargs)
         response.raise_for_status()  # Raise exception for non-200 responses
+        if orjson is not None:
+            return orjson.loads(response.content)
         return response.json()
 
+    def _iter_request(self, endpoint: str, params: Dict[str, Any], json_path: str = "item") -> Iterator[Any]:
+        """
+        Make a GET request and stream records from the response incrementally.
+
+        Unlike _make_request, the full payload is never held in memory at once;
+        records are yielded as they are parsed off the wire. Requires ijson.
+
+        Args:
+            endpoint: API endpoint to call
+            params: Query parameters
+            json_path: ijson path of the records to yield ("item" for a top-level array)
+
+        Yields:
+            Parsed records from the response
+        """
+        if ijson is None:
+            raise ImportError("ijson is required for streaming responses; "
+                              "install it via 'pip install nordpool-client[speed]'")
+
+        url = _endpoint_url(self.BASE_URL, endpoint)
+
+        if httpx is not None and isinstance(self.session, httpx.Client):
+            with self.session.stream("GET", url, params=params) as response:
+                response.raise_for_status()
+                yield from ijson.items(_BytesIterReader(response.iter_bytes()), json_path)
+            return
+
+        if not isinstance(self.session, requests.Session):
+            raise TypeError(f"Streaming is not supported for session type "
+                            f"{type(self.session).__name__}; use a requests.Session or httpx.Client")
+
+        response = self.session.get(url, params=params, stream=True)
+        response.raise_for_status()
+        response.raw.decode_content = True  # stream=True bypasses auto-decompression
+        try:
+            yield from ijson.items(response.raw, json_path)
+        finally:
+            response.close()
+
+    @staticmethod
+    def _join_areas(delivery_areas: List[str], preserve_order: bool = False) -> str:
+        """
+        Join delivery areas into the comma-separated form the API expects.
+
+        Areas are de-duplicated and sorted by default, so equivalent lists
+        produce identical URLs and hit the same HTTP cache entries. Pass
+        preserve_order=True to keep the caller's ordering verbatim.
+        """
+        if preserve_order:
+            return ",".join(delivery_areas)
+        return _cached_join(tuple(sorted(set(delivery_areas))))
+
+    @staticmethod
+    def _normalize_date(query_date: Union[str, date]) -> str:
+        """Return query_date as an ISO string, with a fast path for str input."""
+        return query_date if type(query_date) is str else query_date.isoformat()
+
+    def call(self, name: str, **params) -> Dict:
+        """
+        Dispatch a request through the declarative endpoint table.
+
+        A single tight code path for scripted access and loops, e.g.
+        call("day_ahead_prices", date="2025-03-02", deliveryArea="NO2",
+        market="DayAhead", currency="EUR"). Query parameters use the API's
+        own names and are passed through verbatim, except that date values
+        are normalized and any placeholder in the endpoint template is
+        filled (and consumed) from the parameters.
+
+        Args:
+            name: Key in _ENDPOINTS identifying the endpoint
+            **params: Path and query parameters for the endpoint
+
+        Returns:
+            JSON response as dictionary
+        """
+        try:
+            endpoint = self._ENDPOINTS[name]
+        except KeyError:
+            raise ValueError(f"Unknown endpoint '{name}'; expected one of {sorted(self._ENDPOINTS)}")
+
+        if "date" in params:
+            params["date"] = self._normalize_date(params["date"])
+
+        for field in _template_fields(endpoint):
+            endpoint = endpoint.replace("{%s}" % field, str(params.pop(field)))
+
+        return self._make_request(endpoint, params)
+
     # Auction Data
-    def get_auction_data_availability(self, save=False, **kwargs):
+    def get_auction_data_availability(self, save=False, verbose=False, **kwargs):
         """
         Get the latest available auction data.
 
         Args:
             save (bool): If True, save the response to a JSON file.
+            verbose (bool): If True, print the path the response was saved to.
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -62,27 +356,25 @@ class NordpoolClient:
         """
         endpoint = "AuctionDataAvailability"
         params = {}
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
 
         json_response = self._make_request(endpoint, params)
 
         if save:
-            # Get the directory where this script is located
-
-            # Create a full path for the output file relative to the script directory
-            output_file = os.path.join(self.script_dir, "AuctionDataAvailability.json")
-            with open(output_file, "w") as f:
-                json.dump(json_response, f, indent=4)
-            print(f"Data saved to {output_file}")
+            _dump_json(json_response, self._avail_path)
+            if verbose:
+                print(f"Data saved to {self._avail_path}")
 
         return json_response
 
-    def get_auction_data_availability_latest(self, save=False, **kwargs) -> Dict:
+    def get_auction_data_availability_latest(self, save=False, verbose=False, **kwargs) -> Dict:
         """
         Get the latest available auction data.
 
         Args:
             save (bool): If True, save the response to a JSON file.
+            verbose (bool): If True, print the path the response was saved to.
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -90,16 +382,15 @@ class NordpoolClient:
         """
         endpoint = "AuctionDataAvailability/GetLatest"
         params = {}
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
 
         json_response = self._make_request(endpoint, params)
 
         if save:
-            # Create a full path for the output file relative to the script directory
-            output_file = os.path.join(self.script_dir, "AuctionDataAvailabilityLatest.json")
-            with open(output_file, "w") as f:
-                json.dump(json_response, f, indent=4)
-            print(f"Data saved to {output_file}")
+            _dump_json(json_response, self._avail_latest_path)
+            if verbose:
+                print(f"Data saved to {self._avail_latest_path}")
 
         return json_response
 
@@ -118,17 +409,17 @@ class NordpoolClient:
         Returns:
             Day ahead prices data
         """
-        if isinstance(query_date, date):
-            query_date = query_date.isoformat()
+        query_date = self._normalize_date(query_date)
 
         endpoint = "DayAheadPrices"
         params = {
             "date": query_date,
             "market": market,
-            "deliveryArea": ",".join(delivery_areas),
+            "deliveryArea": self._join_areas(delivery_areas, preserve_order=kwargs.pop("preserve_order", False)),
             "currency": currency
         }
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
 
         return self._make_request(endpoint, params)
 
@@ -147,8 +438,7 @@ class NordpoolClient:
         Returns:
             Price history data for the specified area
         """
-        if isinstance(query_date, date):
-            query_date = query_date.isoformat()
+        query_date = self._normalize_date(query_date)
 
         endpoint = "DayAheadPrices/singleAreaHistory"
         params = {
@@ -157,9 +447,40 @@ class NordpoolClient:
             "deliveryArea": delivery_area,
             "currency": currency
         }
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
         return self._make_request(endpoint, params)
 
+    def get_single_area_price_history_many(self, query_date: Union[str, date], delivery_areas: List[str],
+                                           currency: str = "EUR", market: str = "DayAhead",
+                                           max_workers: int = 16, **kwargs) -> List[Dict]:
+        """
+        Get price history for several delivery areas concurrently.
+
+        The per-area requests are issued in parallel on a thread pool, so the
+        wall time is roughly that of the slowest request rather than the sum.
+        The shared session is thread-safe for separate requests.
+
+        Args:
+            query_date: Date for which to retrieve data (YYYY-MM-DD)
+            delivery_areas: List of delivery area codes
+            currency: Currency code
+            market: Market code
+            max_workers: Upper bound on the number of worker threads
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            List of price history data, in the same order as delivery_areas
+        """
+        if not delivery_areas:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(delivery_areas))) as executor:
+            return list(executor.map(
+                lambda area: self.get_single_area_price_history(query_date, area, currency, market, **kwargs),
+                delivery_areas
+            ))
+
     def get_aggregate_prices(self, year: int, delivery_areas: List[str],
                              currency: str = "EUR", market: str = "DayAhead", **kwargs) -> Dict:
         """
@@ -179,10 +500,11 @@ class NordpoolClient:
         params = {
             "year": year,
             "market": market,
-            "deliveryArea": ",".join(delivery_areas),
+            "deliveryArea": self._join_areas(delivery_areas, preserve_order=kwargs.pop("preserve_order", False)),
             "currency": currency
         }
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
         return self._make_request(endpoint, params)
 
     def get_annual_aggregate_prices(self, delivery_areas: List[str],
@@ -202,10 +524,11 @@ class NordpoolClient:
         endpoint = "AggregatePrices/GetAnnuals"
         params = {
             "market": market,
-            "deliveryArea": ",".join(delivery_areas),
+            "deliveryArea": self._join_areas(delivery_areas, preserve_order=kwargs.pop("preserve_order", False)),
             "currency": currency
         }
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
         return self._make_request(endpoint, params)
 
     def get_system_price(self, query_date: Union[str, date], currency: str = "EUR", **kwargs) -> Dict:
@@ -220,15 +543,15 @@ class NordpoolClient:
         Returns:
             System price data
         """
-        if isinstance(query_date, date):
-            query_date = query_date.isoformat()
+        query_date = self._normalize_date(query_date)
 
         endpoint = "DayAheadSystem"
         params = {
             "date": query_date,
             "currency": currency
         }
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
         return self._make_request(endpoint, params)
 
     def get_day_ahead_volumes(self, query_date: Union[str, date], delivery_areas: List[str],
@@ -245,16 +568,16 @@ class NordpoolClient:
         Returns:
             Day ahead volumes data
         """
-        if isinstance(query_date, date):
-            query_date = query_date.isoformat()
+        query_date = self._normalize_date(query_date)
 
         endpoint = "DayAheadVolumes/multiple"
         params = {
             "date": query_date,
             "market": market,
-            "deliveryAreas": ",".join(delivery_areas)
+            "deliveryAreas": self._join_areas(delivery_areas, preserve_order=kwargs.pop("preserve_order", False))
         }
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
         return self._make_request(endpoint, params)
 
     def get_day_ahead_capacities(self, query_date: Union[str, date], delivery_area: str,
@@ -271,8 +594,7 @@ class NordpoolClient:
         Returns:
             Day ahead capacities data
         """
-        if isinstance(query_date, date):
-            query_date = query_date.isoformat()
+        query_date = self._normalize_date(query_date)
 
         endpoint = "DayAheadCapacities"
         params = {
@@ -280,7 +602,8 @@ class NordpoolClient:
             "market": market,
             "deliveryArea": delivery_area
         }
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
         return self._make_request(endpoint, params)
 
     def get_day_ahead_flow(self, query_date: Union[str, date], delivery_area: str,
@@ -297,8 +620,7 @@ class NordpoolClient:
         Returns:
             Day ahead flow data
         """
-        if isinstance(query_date, date):
-            query_date = query_date.isoformat()
+        query_date = self._normalize_date(query_date)
 
         endpoint = "DayAheadFlow"
         params = {
@@ -306,7 +628,8 @@ class NordpoolClient:
             "market": market,
             "deliveryArea": delivery_area
         }
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
         return self._make_request(endpoint, params)
 
     def get_aggregated_bid_curves(self, query_date: Union[str, date], market_code: str,
@@ -323,8 +646,7 @@ class NordpoolClient:
         Returns:
             Aggregated bidding curves data
         """
-        if isinstance(query_date, date):
-            query_date = query_date.isoformat()
+        query_date = self._normalize_date(query_date)
 
         endpoint = "AggregatedBidCurves"
         params = {
@@ -332,9 +654,40 @@ class NordpoolClient:
             "marketCode": market_code,
             "clusterName": cluster_name
         }
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
         return self._make_request(endpoint, params)
 
+    def iter_aggregated_bid_curves(self, query_date: Union[str, date], market_code: str,
+                                   cluster_name: str, json_path: str = "item", **kwargs) -> Iterator[Any]:
+        """
+        Stream aggregated bidding curves record by record.
+
+        A memory-friendly variant of get_aggregated_bid_curves: records are
+        yielded as they arrive instead of materialising the full payload.
+
+        Args:
+            query_date: Date for which to retrieve data (YYYY-MM-DD)
+            market_code: Market code (e.g., NPSDA, IDA2)
+            cluster_name: Cluster name (e.g., BALTIC, NO)
+            json_path: ijson path of the records to yield
+            **kwargs: Additional parameters to pass to the API
+
+        Yields:
+            Aggregated bidding curve records
+        """
+        query_date = self._normalize_date(query_date)
+
+        endpoint = "AggregatedBidCurves"
+        params = {
+            "date": query_date,
+            "marketCode": market_code,
+            "clusterName": cluster_name
+        }
+        if kwargs:
+            params.update(kwargs)
+        return self._iter_request(endpoint, params, json_path=json_path)
+
     def get_scheduled_physical_flows(self, query_date: Union[str, date], delivery_area: str,
                                      market: str = "DayAhead", **kwargs) -> Dict:
         """
@@ -349,8 +702,7 @@ class NordpoolClient:
         Returns:
             Scheduled physical flows data
         """
-        if isinstance(query_date, date):
-            query_date = query_date.isoformat()
+        query_date = self._normalize_date(query_date)
 
         endpoint = "DayAheadFlow/scheduledPhysicalFlows"
         params = {
@@ -358,7 +710,8 @@ class NordpoolClient:
             "market": market,
             "deliveryArea": delivery_area
         }
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
         return self._make_request(endpoint, params)
 
     def get_flow_based_constraints(self, query_date: Union[str, date], flow_based_domain: str,
@@ -375,8 +728,7 @@ class NordpoolClient:
         Returns:
             Flow-based constraints data
         """
-        if isinstance(query_date, date):
-            query_date = query_date.isoformat()
+        query_date = self._normalize_date(query_date)
 
         endpoint = "AuctionFlowConstraints"
         params = {
@@ -384,7 +736,8 @@ class NordpoolClient:
             "market": market,
             "flowBasedDomain": flow_based_domain
         }
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
         return self._make_request(endpoint, params)
 
     # EPAD data
@@ -400,12 +753,12 @@ class NordpoolClient:
         Returns:
             EPAD auction results
         """
-        if isinstance(query_date, date):
-            query_date = query_date.isoformat()
+        query_date = self._normalize_date(query_date)
 
         endpoint = f"EpadData/results/{query_date}"
         params = {}
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
         return self._make_request(endpoint, params)
 
     def get_epad_yearly_results(self, year: int, **kwargs) -> Dict:
@@ -421,7 +774,8 @@ class NordpoolClient:
         """
         endpoint = f"EpadData/years/results/{year}"
         params = {}
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
         return self._make_request(endpoint, params)
 
     def get_epad_bid_curves(self, query_date: Union[str, date], **kwargs) -> Dict:
@@ -435,14 +789,37 @@ class NordpoolClient:
         Returns:
             EPAD bid curves
         """
-        if isinstance(query_date, date):
-            query_date = query_date.isoformat()
+        query_date = self._normalize_date(query_date)
 
         endpoint = f"EpadData/bid-curves/{query_date}"
         params = {}
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
         return self._make_request(endpoint, params)
 
+    def iter_epad_bid_curves(self, query_date: Union[str, date], json_path: str = "item",
+                             **kwargs) -> Iterator[Any]:
+        """
+        Stream EPAD bid curves record by record.
+
+        A memory-friendly variant of get_epad_bid_curves.
+
+        Args:
+            query_date: Date for which to retrieve data (YYYY-MM-DD)
+            json_path: ijson path of the records to yield
+            **kwargs: Additional parameters to pass to the API
+
+        Yields:
+            EPAD bid curve records
+        """
+        query_date = self._normalize_date(query_date)
+
+        endpoint = f"EpadData/bid-curves/{query_date}"
+        params = {}
+        if kwargs:
+            params.update(kwargs)
+        return self._iter_request(endpoint, params, json_path=json_path)
+
     def get_epad_yearly_bid_curves(self, year: int, **kwargs) -> Dict:
         """
         Get yearly EPAD bid curves.
@@ -456,9 +833,30 @@ class NordpoolClient:
         """
         endpoint = f"EpadData/years/bid-curve/{year}"
         params = {}
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
         return self._make_request(endpoint, params)
 
+    def iter_epad_yearly_bid_curves(self, year: int, json_path: str = "item", **kwargs) -> Iterator[Any]:
+        """
+        Stream yearly EPAD bid curves record by record.
+
+        A memory-friendly variant of get_epad_yearly_bid_curves.
+
+        Args:
+            year: Year for which to retrieve data
+            json_path: ijson path of the records to yield
+            **kwargs: Additional parameters to pass to the API
+
+        Yields:
+            Yearly EPAD bid curve records
+        """
+        endpoint = f"EpadData/years/bid-curve/{year}"
+        params = {}
+        if kwargs:
+            params.update(kwargs)
+        return self._iter_request(endpoint, params, json_path=json_path)
+
     # Intraday market
 
     def get_intraday_market_statistics(self, query_date: Union[str, date], delivery_area: str, **kwargs) -> Dict:
@@ -473,15 +871,15 @@ class NordpoolClient:
         Returns:
             Intraday market statistics
         """
-        if isinstance(query_date, date):
-            query_date = query_date.isoformat()
+        query_date = self._normalize_date(query_date)
 
         endpoint = "IntradayMarketStatistics"
         params = {
             "date": query_date,
             "deliveryArea": delivery_area
         }
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
         return self._make_request(endpoint, params)
 
     def get_intraday_hourly_statistics(self, query_date: Union[str, date], delivery_area: str, **kwargs) -> Dict:
@@ -496,15 +894,15 @@ class NordpoolClient:
         Returns:
             Hourly intraday market statistics
         """
-        if isinstance(query_date, date):
-            query_date = query_date.isoformat()
+        query_date = self._normalize_date(query_date)
 
         endpoint = "IntradayMarketStatistics/hourly"
         params = {
             "date": query_date,
             "deliveryArea": delivery_area
         }
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
         return self._make_request(endpoint, params)
 
     # Power system data
@@ -522,15 +920,15 @@ class NordpoolClient:
         Returns:
             mFRR data
         """
-        if isinstance(query_date, date):
-            query_date = query_date.isoformat()
+        query_date = self._normalize_date(query_date)
 
         endpoint = "ManualFrequencyRestorationReserve/multiple"
         params = {
             "date": query_date,
-            "deliveryAreas": ",".join(delivery_areas)
+            "deliveryAreas": self._join_areas(delivery_areas, preserve_order=kwargs.pop("preserve_order", False))
         }
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
         return self._make_request(endpoint, params)
 
     def get_consumption(self, query_date: Union[str, date], delivery_areas: List[str],
@@ -547,16 +945,16 @@ class NordpoolClient:
         Returns:
             Consumption data
         """
-        if isinstance(query_date, date):
-            query_date = query_date.isoformat()
+        query_date = self._normalize_date(query_date)
 
         endpoint = "Consumption"
         params = {
             "date": query_date,
-            "deliveryAreas": ",".join(delivery_areas),
+            "deliveryAreas": self._join_areas(delivery_areas, preserve_order=kwargs.pop("preserve_order", False)),
             "locations": ",".join(locations) if locations else ""
         }
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
         return self._make_request(endpoint, params)
 
     def get_consumption_forecast(self, query_date: Union[str, date], delivery_areas: List[str],
@@ -573,16 +971,16 @@ class NordpoolClient:
         Returns:
             Consumption forecast data
         """
-        if isinstance(query_date, date):
-            query_date = query_date.isoformat()
+        query_date = self._normalize_date(query_date)
 
         endpoint = "ConsumptionPrognoses"
         params = {
             "date": query_date,
-            "deliveryAreas": ",".join(delivery_areas),
+            "deliveryAreas": self._join_areas(delivery_areas, preserve_order=kwargs.pop("preserve_order", False)),
             "locations": ",".join(locations) if locations else ""
         }
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
         return self._make_request(endpoint, params)
 
     def get_production(self, query_date: Union[str, date], delivery_area: str,
@@ -599,8 +997,7 @@ class NordpoolClient:
         Returns:
             Production data
         """
-        if isinstance(query_date, date):
-            query_date = query_date.isoformat()
+        query_date = self._normalize_date(query_date)
 
         endpoint = "ProductionData"
         params = {
@@ -608,7 +1005,8 @@ class NordpoolClient:
             "deliveryArea": delivery_area,
             "location": location
         }
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
         return self._make_request(endpoint, params)
 
     def get_physical_flows(self, query_date: Union[str, date], delivery_area: str, **kwargs) -> Dict:
@@ -623,29 +1021,21 @@ class NordpoolClient:
         Returns:
             Physical flows data
         """
-        if isinstance(query_date, date):
-            query_date = query_date.isoformat()
+        query_date = self._normalize_date(query_date)
 
         endpoint = "PhysicalFlows"
         params = {
             "date": query_date,
             "deliveryArea": delivery_area
         }
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
         return self._make_request(endpoint, params)
 
     def _update_market_config(self):
-
-        # Prepare a dictionary to store the extracted information
-        self.markets_info = {}
-
-        for market in self.auction_config:
-            market_key = market.get("market", "Unknown")
-            display_name = market.get("marketDisplayName", "")
-
-            self.markets_info[market_key] = display_name
-
-        return self.markets_info
+        # Extract the market code -> display name mapping from the auction config
+        self._markets_info = {m["market"]: m.get("marketDisplayName", "")
+                              for m in self.auction_config if "market" in m}
 
 
 if __name__ == '__main__':